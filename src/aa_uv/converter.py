@@ -104,7 +104,7 @@ def parse_args(args):
                    )
     p.add_argument("-p",
                    "--parallel_backend",
-                   help="Joblib backend to use: 'loky' (default) or 'dask' ",
+                   help="Joblib backend to use: 'loky' (default), 'threading' or 'dask' ",
                    required=False,
                    default="loky")
     p.add_argument("-N",
@@ -9,9 +9,9 @@ from loguru import logger
 from astropy.coordinates import EarthLocation, SkyCoord, AltAz, Angle
 from astropy.time import Time
 from astropy.units import Quantity
-import pyuvdata.utils as uvutils
 
 from aa_uv.utils import get_resource_path, load_yaml
+from aa_uv.uvw_utils import calc_apparent_lst
 
 # Define the data class for UV data
 @dataclass
@@ -46,6 +46,29 @@ def create_empty_provenance_dict():
     return provenance
 
 
+def _ecef_from_enu_relative(enu: np.ndarray, lat_rad: float, lon_rad: float) -> np.ndarray:
+    """ Rotate ENU positions into ECEF XYZ, relative to the ENU origin
+
+    Args:
+        enu (np.ndarray): East-North-Up positions, shape (N, 3)
+        lat_rad (float): Latitude of ENU origin, in radians
+        lon_rad (float): Longitude of ENU origin, in radians
+
+    Returns:
+        xyz (np.ndarray): ECEF XYZ - XYZ0 positions, shape (N, 3)
+
+    Notes:
+        Equivalent to ``uvutils.ECEF_from_ENU(enu, lat, lon, alt) - xyz0``, but skips
+        adding and then subtracting the array origin.
+    """
+    sin_lat, cos_lat = np.sin(lat_rad), np.cos(lat_rad)
+    sin_lon, cos_lon = np.sin(lon_rad), np.cos(lon_rad)
+    R = np.array([[-sin_lon, -sin_lat * cos_lon, cos_lat * cos_lon],
+                  [ cos_lon, -sin_lat * sin_lon, cos_lat * sin_lon],
+                  [ 0,        cos_lat,           sin_lat]])
+    return enu @ R.T
+
+
 def create_antenna_data_array(antpos: pd.DataFrame, eloc: EarthLocation) -> xp.Dataset:
     """ Create an xarray Dataset for antenna locations
 
@@ -80,10 +103,9 @@ def create_antenna_data_array(antpos: pd.DataFrame, eloc: EarthLocation) -> xp.D
 
     lat_rad = eloc.lat.to('rad').value
     lon_rad = eloc.lon.to('rad').value
-    x0, y0, z0 = [_.to('m').value for _ in eloc.to_geocentric()]
 
-    antpos_enu   = np.column_stack((antpos['E'], antpos['N'], antpos['U']))
-    antpos_ecef  = uvutils.ECEF_from_ENU(antpos_enu, lat_rad, lon_rad, eloc.height)  - (x0, y0, z0)
+    antpos_enu   = antpos[['E', 'N', 'U']].to_numpy(dtype='float64')
+    antpos_ecef  = _ecef_from_enu_relative(antpos_enu, lat_rad, lon_rad)
 
     # Check if flags in antpos, otherwise add column
     if 'flagged' not in antpos.columns:
@@ -179,9 +201,10 @@ def create_visibility_array(data: np.ndarray, f: Quantity, t: Time, eloc: EarthL
     uvx_schema = load_yaml(get_resource_path('datamodel/uvx.yaml'))
 
     # Coordinate - time
-    t.location = eloc
-    lst = t.sidereal_time('apparent').to('hourangle')
-    t_coord = pd.MultiIndex.from_arrays((t.mjd, lst.value, t.unix), names=('mjd', 'lst', 'unix'))
+    # LST is always computed for eloc; a new Time is made so the caller's Time is not modified
+    t = Time(t, location=eloc, copy=False)
+    lst = calc_apparent_lst(t) * (12 / np.pi)  # radians -> hourangle
+    t_coord = pd.MultiIndex.from_arrays((t.mjd, lst, t.unix), names=('mjd', 'lst', 'unix'))
 
     # Coordinate - baseline
     ix, iy = np.triu_indices(N_ant)
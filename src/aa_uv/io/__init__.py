@@ -3,7 +3,7 @@ from ..utils import import_optional_dependency
 # hdf5_to_uv()         - Convert to internal UV dataclass
 # hdf5_to_sdp_vis()    - Convert to SKA SDP Visibility data model
 # hdf5_to_uvdata()     - Convert to pyuvdata
-from .to_uvx import  load_observation_metadata, hdf5_to_uvx, get_hdf5_metadata
+from .to_uvx import  load_observation_metadata, hdf5_to_uvx, hdf5_to_uvx_many, get_hdf5_metadata
 try:
     import_optional_dependency('ska_sdp_datamodels')
     from .to_sdp import hdf5_to_sdp_vis, uvdata_to_sdp_vis
@@ -20,9 +20,11 @@ import pyuvdata
 from pyuvdata import UVData
 import pyuvdata.utils as uvutils
 
-from aa_uv.io.to_uvx import load_observation_metadata
+from aa_uv.io.to_uvx import load_observation_metadata, read_antenna_locations, read_hdf5_data, HDF5_READ_KWARGS
 from aa_uv.datamodel import UVX
 from aa_uv.utils import get_resource_path, load_yaml
+from aa_uv.uvw_utils import calc_zenith_icrs
+from aa_uv.vis_utils import remap_pols
 from aa_uv import __version__
 
 def phase_to_sun(uv: UVData, t0: Time) -> UVData:
@@ -189,7 +191,7 @@ def uvx_to_pyuvdata(uvx: UVX, phase_to_t0: bool=True,
 
     # Compute zenith phase center
     zen_aa = AltAz(alt=Angle(90, unit='degree'), az=Angle(0, unit='degree'), obstime=t0, location=uvx.origin)
-    zen_sc = SkyCoord(zen_aa)
+    zen_sc = calc_zenith_icrs(t0, uvx.origin)
 
     phs_id = uv._add_phase_center(
         cat_name=f"zenith_at_jd{t0.jd}",
@@ -204,8 +206,8 @@ def uvx_to_pyuvdata(uvx: UVX, phase_to_t0: bool=True,
     )
 
     uv.phase_center_id_array  = np.zeros(uv.Nblts, dtype='int32') + phs_id
-    uv.phase_center_app_ra    = np.zeros(uv.Nblts, dtype='float64') + zen_sc.icrs.ra.rad
-    uv.phase_center_app_dec   = np.zeros(uv.Nblts, dtype='float64') + zen_sc.icrs.dec.rad
+    uv.phase_center_app_ra    = np.zeros(uv.Nblts, dtype='float64') + zen_sc.ra.rad
+    uv.phase_center_app_dec   = np.zeros(uv.Nblts, dtype='float64') + zen_sc.dec.rad
     uv.phase_center_frame_pa  = np.zeros(uv.Nblts, dtype='float64')
 
     # Next, load up data
@@ -308,12 +310,12 @@ def hdf5_to_pyuvdata(filename: str, yaml_config: str=None, telescope_name: str=N
     telescope_earthloc = EarthLocation.from_geocentric(*uv.telescope_location, unit='m')
 
     # Load baselines and antenna locations (ENU)
-    df_ant = pd.read_csv(md['antenna_locations_file'], delimiter=' ')
+    df_ant = read_antenna_locations(md['antenna_locations_file'])
     df_bl  = pd.read_csv(md['baseline_order_file'], delimiter=' ')
 
     # Convert ENU locations to 'local' ECEF
     # Following https://github.com/RadioAstronomySoftwareGroup/pyuvdata/blob/f703a985869b974892fc4732910c83790f9c72b4/pyuvdata/uvdata/mwa_corr_fits.py#L1456
-    antpos_ENU  = np.column_stack((df_ant['E'], df_ant['N'], df_ant['U']))
+    antpos_ENU  = df_ant[['E', 'N', 'U']].to_numpy(dtype='float64')
     antpos_ECEF = uvutils.ECEF_from_ENU(antpos_ENU, *uv.telescope_location_lat_lon_alt) - uv.telescope_location
 
     # Now fill in antenna info fields
@@ -345,9 +347,11 @@ def hdf5_to_pyuvdata(filename: str, yaml_config: str=None, telescope_name: str=N
 
     # Time axis
     # Compute JD from unix time and LST - we can do this as we set an EarthLocation on t0 Time
-    _t = np.arange(md['n_integrations'], dtype='float64') * md['tsamp'] + md['ts_start']
-    _t += md['tsamp'] / 2 # Time array is based on center of integration, so add tdelt / 2
-    _t += start_int *  md['tsamp']  # Add time offset if not reading from t0
+    # Time array is based on center of integration, so add tdelt / 2,
+    # plus time offset if not reading from t0. Offsets are summed first, so _t is built in place.
+    _t = np.arange(md['n_integrations'], dtype='float64')
+    _t *= md['tsamp']
+    _t += md['ts_start'] + (start_int + 0.5) * md['tsamp']
 
     t = Time(_t, format='unix', location=telescope_earthloc)
     t0 = t[0]
@@ -376,7 +380,7 @@ def hdf5_to_pyuvdata(filename: str, yaml_config: str=None, telescope_name: str=N
 
     # Compute zenith phase center
     zen_aa = AltAz(alt=Angle(90, unit='degree'), az=Angle(0, unit='degree'), obstime=t0, location=t0.location)
-    zen_sc = SkyCoord(zen_aa)
+    zen_sc = calc_zenith_icrs(t0, t0.location)
 
     phs_id = uv._add_phase_center(
         cat_name=f"zenith_at_jd{t0.jd}",
@@ -391,29 +395,32 @@ def hdf5_to_pyuvdata(filename: str, yaml_config: str=None, telescope_name: str=N
     )
 
     uv.phase_center_id_array  = np.zeros(uv.Nblts, dtype='int32') + phs_id
-    uv.phase_center_app_ra    = np.zeros(uv.Nblts, dtype='float64') + zen_sc.icrs.ra.rad
-    uv.phase_center_app_dec   = np.zeros(uv.Nblts, dtype='float64') + zen_sc.icrs.dec.rad
+    uv.phase_center_app_ra    = np.zeros(uv.Nblts, dtype='float64') + zen_sc.ra.rad
+    uv.phase_center_app_dec   = np.zeros(uv.Nblts, dtype='float64') + zen_sc.dec.rad
     uv.phase_center_frame_pa  = np.zeros(uv.Nblts, dtype='float64')
 
     # Next, load up data
-    with h5py.File(filename, mode='r') as datafile:
+    with h5py.File(filename, mode='r', **HDF5_READ_KWARGS) as datafile:
         # Data have shape (nint, nbaseline, nspw, npol)
         # Need to flatten to (nbaseline * nint (Nblts), nspw, nchan, npol)
         n_int = md['n_integrations']
-        data = datafile['correlation_matrix']['data'][start_int:(start_int + n_int)]
+        data = read_hdf5_data(datafile['correlation_matrix']['data'], time_slice=slice(start_int, start_int + n_int))
         #uv.data_array = np.transpose(data, (0, 2, 1, 3))
-        uv.data_array = data.reshape((uv.Nblts, uv.Nspws, uv.Nfreqs, uv.Npols))
+        data = data.reshape((uv.Nblts, uv.Nspws, uv.Nfreqs, uv.Npols))
+
+        if conj:
+            logger.info('Conjugating data')
 
         # HDF5 data are written as XX, XY, YX, YY (AIPS codes -5, -7, -8, -6)
         if md['polarization_type'].lower() == 'linear_crossed':
-            # AIPS expects -5 -6 -7 -8, so we need to remap pols
+            # AIPS expects -5 -6 -7 -8, so we need to remap pols (conjugating in the same pass)
             pol_remap = [0, 3, 1, 2]
-            uv.data_array = uv.data_array[..., pol_remap]
+            data = remap_pols(data, pol_remap, conj=conj)
             uv.polarization_array = _pol_types['linear']
+        elif conj:
+            np.conjugate(data, out=data)
 
-        if conj:
-            logger.info('Conjugating data')
-            uv.data_array = np.conj(uv.data_array)
+        uv.data_array = data
 
         # Add optional arrays
         uv.flag_array = np.zeros_like(uv.data_array, dtype='bool')
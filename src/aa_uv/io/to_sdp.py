@@ -17,6 +17,7 @@ from ska_sdp_datamodels.science_data_model import ReceptorFrame, PolarisationFra
 
 from aa_uv.io.to_uvx import hdf5_to_uvx
 from aa_uv.uvw_utils import calc_uvw, calc_zenith_tracking_phase_corr, calc_zenith_apparent_coords
+from aa_uv.vis_utils import remap_pols
 
 
 def hdf5_to_sdp_vis(fn_raw: str, yaml_config: str=None, telescope_name: str=None, conj: bool=True,
@@ -50,8 +51,7 @@ def hdf5_to_sdp_vis(fn_raw: str, yaml_config: str=None, telescope_name: str=None
     md = uv.provenance['input_metadata']
 
 
-    # Create Configuration and Frames
-    config    = Configuration()
+    # Create Frames
     rec_frame = ReceptorFrame('linear')
     pol_frame = PolarisationFrame('linear')
 
@@ -59,25 +59,24 @@ def hdf5_to_sdp_vis(fn_raw: str, yaml_config: str=None, telescope_name: str=None
     antpos_ECEF = uv.antennas.ecef.values
     telescope_earthloc = uv.origin
 
-    config = config.constructor(
+    config = Configuration.constructor(
         name=md['telescope_name'],
         names=uv.antennas.attrs['identifier'].values,
-        stations=[f'{x}' for x in range(md['n_antennas'])],
+        stations=np.arange(md['n_antennas']).astype('str'),
         location=telescope_earthloc,
         xyz=antpos_ECEF,
         receptor_frame=rec_frame,
         diameter=1.0,  # Errors if not set
         mount='altaz')
 
-    baselines = pd.MultiIndex.from_arrays(
-        (uv.data.baseline.ant1.values, uv.data.baseline.ant2.values), names=("antenna1", "antenna2")
-    )
+    # Reuse existing (ant1, ant2) baseline MultiIndex, rather than rebuilding it
+    baselines = uv.data.indexes['baseline'].set_names(["antenna1", "antenna2"])
 
     # Time and frequency
     t  = uv.timestamps
-    t_int = np.ones_like(t) * md['tsamp']
+    t_int = np.full(t.shape, md['tsamp'], dtype='float64')
     fc = uv.data.frequency.values
-    fbw = np.ones_like(fc) * uv.data.frequency.attrs['channel_bandwidth']
+    fbw = np.full(fc.shape, uv.data.frequency.attrs['channel_bandwidth'], dtype='float64')
 
     # Phase center
     zen_sc = uv.phase_center.icrs
@@ -88,12 +87,18 @@ def hdf5_to_sdp_vis(fn_raw: str, yaml_config: str=None, telescope_name: str=None
     if flip_uvw:
         uvw *= -1
 
-    # Load data from file
+    # Load data from file -- transpose is a strided view, not a copy
     vis_data = uv.data.transpose('time', 'baseline', 'frequency', 'polarization').values
-    phs_corr = calc_zenith_tracking_phase_corr(uv)
 
     if apply_phasing:
-        vis_data *= phs_corr
+        # Apply phasing and write into a new contiguous complex64 buffer, in a single pass
+        phs_corr = calc_zenith_tracking_phase_corr(uv)
+        vis_view = vis_data
+        vis_data = np.empty(vis_view.shape, dtype='complex64')
+        np.multiply(vis_view, phs_corr, out=vis_data, casting='same_kind')
+    else:
+        # Cast and reorder into (t, bl, f, p) memory layout in one pass (no-op for a single channel)
+        vis_data = np.ascontiguousarray(vis_data, dtype='complex64')
 
     # Create SDP visibility
     v = Visibility.constructor(
@@ -101,9 +106,9 @@ def hdf5_to_sdp_vis(fn_raw: str, yaml_config: str=None, telescope_name: str=None
             time=t.mjd * 86400,
             frequency=fc,
             vis=vis_data,
-            weight=np.ones(vis_data.shape),
+            weight=np.ones(vis_data.shape, dtype="float32"),
             baselines=baselines,
-            flags=np.zeros(vis_data.shape, dtype="int"),
+            flags=np.zeros(vis_data.shape, dtype="uint8"),
             integration_time=t_int,
             channel_bandwidth=fbw,
             polarisation_frame=pol_frame,
@@ -130,9 +135,8 @@ def uvdata_to_sdp_vis(uv: UVData, scan_id: int=0, scan_intent: str="", execblock
         v (Visibility): SDP Visibility object
     """
 
-    # Create Configuration and Frames
+    # Create Frames
     # TODO: Derive from UVData
-    config    = Configuration()
     rec_frame = ReceptorFrame('linear')
     pol_frame = PolarisationFrame('linear')
 
@@ -141,7 +145,7 @@ def uvdata_to_sdp_vis(uv: UVData, scan_id: int=0, scan_intent: str="", execblock
     antpos_ECEF = uv.antenna_positions
 
     # Instantiate config
-    config = config.constructor(
+    config = Configuration.constructor(
         name=uv.telescope_name,
         names=uv.antenna_names,
         stations=len(uv.antenna_numbers),
@@ -152,24 +156,16 @@ def uvdata_to_sdp_vis(uv: UVData, scan_id: int=0, scan_intent: str="", execblock
         mount='altaz')
 
     # Setup time -- note time_array is Nbls*Nt long, we assume it is ordered
-    t = Time(uv.time_array[::uv.Nbls], format='jd', location=telescope_earthloc)
-    t_lst= t.sidereal_time('apparent').to('rad').value
-    t0 = Time(np.round(t[0].mjd), format='mjd')
+    # Reshape time array -- only need one entry per timestep
+    t = Time(uv.time_array.reshape((uv.Ntimes, uv.Nbls))[:, 0], format='jd', location=telescope_earthloc)
 
     # Setup frequency
     f_c  = uv.freq_array[0]   # TODO: handle multiple spectral windows
-    f_bw = np.ones_like(f_c) * uv.channel_width
+    f_bw = np.full(f_c.shape, uv.channel_width, dtype='float64')
 
     if len(uv.freq_array) > 1:
         raise NotImplementedError("Only length-1 frequency arrays supported at present.")
 
-    # setup phase center
-    pc_id = sorted(uv.phase_center_catalog.keys())[0]
-    pcd = uv.phase_center_catalog[pc_id]
-    pc_name = pcd['cat_name']
-    pc_sc = SkyCoord(pcd['cat_lon'], pcd['cat_lat'], unit=('rad', 'rad'))
-    pc_hourangle = t.sidereal_time('apparent').to('rad').value - pc_sc.icrs.ra.to('hourangle').to('rad').value
-
     #integration_time (float, optional) – Only used in the specific case where times only has one element
     t_int = uv.integration_time[0] if uv.Ntimes == 1 else None
 
@@ -182,19 +178,12 @@ def uvdata_to_sdp_vis(uv: UVData, scan_id: int=0, scan_intent: str="", execblock
     if flip_uvw:
         uvw *= -1
 
-    # Reshape time array -- only need one entry per timestep
-    t = Time(uv.time_array.reshape((uv.Ntimes, uv.Nbls))[:, 0], format='jd', location=telescope_earthloc)
-    t_lst= t.sidereal_time('apparent').to('rad').value
-
     # Reshape visibility array -- should be same layout so no worries here
     vis_data = uv.data_array.reshape((uv.Ntimes, uv.Nbls, 1, 4))
 
 
-    # Remap XX.YY,XY,YX -> XX,XY,YX,YY
-    vis_data = vis_data[..., [0,2,3,1]]
-
-    if conj:
-        vis_data = np.conj(vis_data)
+    # Remap XX.YY,XY,YX -> XX,XY,YX,YY (and conjugate) in a single pass
+    vis_data = remap_pols(vis_data, (0, 2, 3, 1), conj=conj, dtype='complex64')
 
     # Generate baseline IDs
     baselines = pd.MultiIndex.from_arrays(
@@ -210,9 +199,9 @@ def uvdata_to_sdp_vis(uv: UVData, scan_id: int=0, scan_intent: str="", execblock
             time=t.mjd * 86400,
             frequency=f_c,
             vis=vis_data,
-            weight=np.ones(vis_data.shape),
+            weight=np.ones(vis_data.shape, dtype="float32"),
             baselines=baselines,
-            flags=np.zeros(vis_data.shape, dtype="int"),
+            flags=np.zeros(vis_data.shape, dtype="uint8"),
             integration_time=t_int,
             channel_bandwidth=f_bw,
             polarisation_frame=pol_frame,
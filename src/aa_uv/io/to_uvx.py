@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 import h5py
 import numpy as np
 import pandas as pd
@@ -6,20 +7,27 @@ from loguru import logger
 
 from astropy.time import Time
 from astropy.units import Quantity
-from astropy.coordinates import SkyCoord, AltAz, EarthLocation, Angle
+from astropy.coordinates import EarthLocation
 
 from aa_uv.io.mccs_yaml import station_location_from_platform_yaml
+from aa_uv.io.uvx import write_uvx
 from aa_uv.datamodel.uvx import UVX, create_antenna_data_array, create_visibility_array, create_empty_context_dict, create_empty_provenance_dict
-from aa_uv.utils import get_config_path, get_software_versions, load_yaml
+from aa_uv.utils import get_config_path, get_software_versions, load_yaml, load_config as load_internal_config
+from aa_uv.uvw_utils import calc_zenith_icrs
 
 from aa_uv import __version__ as aa_uv_version
 
+# Size of each read of correlator data, and of the HDF5 chunk cache used for it
+HDF5_SLAB_BYTES = 64 * 1024**2
+# h5py.File keyword arguments used when opening correlator files for reading
+HDF5_READ_KWARGS = {'rdcc_nbytes': HDF5_SLAB_BYTES, 'rdcc_nslots': 1_000_003}
+
 
 def load_observation_metadata(filename: str, yaml_config: str=None, load_config: str=None) -> dict:
     """ Load observation metadata from correlator output HDF5
 
     Args:
-        filename (str): Path to HDF5 file
+        filename (str): Path to HDF5 file, or an open h5py.File
         yaml_config (str): Path to YAML station configuration file
         load_config (str): Name of config to load from aa_uv package
 
@@ -33,8 +41,10 @@ def load_observation_metadata(filename: str, yaml_config: str=None, load_config:
     if yaml_config is None:
         logger.info(f'Using internal config {load_config}')
         yaml_config = get_config_path(load_config)
-
-    md_yaml = load_yaml(yaml_config)
+        # Internal configs are parsed once and cached; a copy is returned
+        md_yaml = load_internal_config(load_config)
+    else:
+        md_yaml = load_yaml(yaml_config)
     md.update(md_yaml)
 
     md['history'] = f'Created with aa_uv {aa_uv_version}'
@@ -48,32 +58,105 @@ def load_observation_metadata(filename: str, yaml_config: str=None, load_config:
 
 
 def get_hdf5_metadata(filename: str) -> dict:
-    """ Extract metadata from HDF5 and perform checks """
-    with h5py.File(filename, mode='r') as datafile:
-        expected_keys = ['n_antennas', 'ts_end', 'n_pols', 'n_beams', 'tile_id', 'n_chans', 'n_samples', 'type',
-                         'data_type', 'data_mode', 'ts_start', 'n_baselines', 'n_stokes', 'channel_id', 'timestamp',
-                         'date_time', 'n_blocks']
-
-        # Check that keys are present
-        if set(expected_keys) - set(datafile.get('root').attrs.keys()) != set(): # pragma: no cover
-            raise Exception("Missing metadata in file")
-
-        # All good, get metadata
-        metadata = {k: v for (k, v) in datafile.get('root').attrs.items()}
-        metadata['n_integrations'] = metadata['n_blocks'] * metadata['n_samples']
-        metadata['data_shape'] = datafile['correlation_matrix']['data'].shape
-
-        # Overwrite ts_start with value from sample_timestamps/data
-        # This is a WAR as h['root'].attrs['ts_start'] does not update
-        # if a long observation spans multiple HDF5 files
-        # (see https://github.com/ska-sci-ops/aa_uv/issues/48)
-        metadata['ts_start'] = datafile['sample_timestamps/data'][0][0]
+    """ Extract metadata from HDF5 and perform checks
+
+    Args:
+        filename (str): Path to HDF5 file, or an open h5py.File (which is left open)
+    """
+    if isinstance(filename, h5py.File):
+        return _get_hdf5_metadata(filename)
+
+    with h5py.File(filename, mode='r', **HDF5_READ_KWARGS) as datafile:
+        return _get_hdf5_metadata(datafile)
+
+
+def _get_hdf5_metadata(datafile: h5py.File) -> dict:
+    """ Extract metadata from an open HDF5 correlator file """
+    expected_keys = ['n_antennas', 'ts_end', 'n_pols', 'n_beams', 'tile_id', 'n_chans', 'n_samples', 'type',
+                     'data_type', 'data_mode', 'ts_start', 'n_baselines', 'n_stokes', 'channel_id', 'timestamp',
+                     'date_time', 'n_blocks']
+
+    # Check that keys are present
+    if set(expected_keys) - set(datafile.get('root').attrs.keys()) != set(): # pragma: no cover
+        raise Exception("Missing metadata in file")
+
+    # All good, get metadata
+    metadata = {k: v for (k, v) in datafile.get('root').attrs.items()}
+    metadata['n_integrations'] = metadata['n_blocks'] * metadata['n_samples']
+    metadata['data_shape'] = datafile['correlation_matrix']['data'].shape
+
+    # Overwrite ts_start with value from sample_timestamps/data
+    # This is a WAR as h['root'].attrs['ts_start'] does not update
+    # if a long observation spans multiple HDF5 files
+    # (see https://github.com/ska-sci-ops/aa_uv/issues/48)
+    metadata['ts_start'] = datafile['sample_timestamps/data'][0][0]
     return metadata
 
 
+def read_antenna_locations(filename: str) -> pd.DataFrame:
+    """ Read an antenna locations file into a pandas DataFrame
+
+    Args:
+        filename (str): Path to space-delimited antenna locations file, with
+                        columns ``idx | name | E | N | U | flagged`` (flagged is optional)
+
+    Returns:
+        antpos (pd.DataFrame): DataFrame of antenna positions, as used by create_antenna_data_array
+
+    Notes:
+        Column dtypes are given explicitly and parsed with the C engine, which avoids
+        per-column type inference. Columns that are not present in the file are ignored.
+    """
+    dtypes = {'idx': 'int64', 'name': 'str', 'E': 'float64', 'N': 'float64', 'U': 'float64', 'flagged': 'bool'}
+    return pd.read_csv(filename, delimiter=' ', engine='c', dtype=dtypes)
+
+
+def read_hdf5_data(dset: h5py.Dataset, time_slice: slice=None, freq_slice: slice=None,
+                    slab_bytes: int=HDF5_SLAB_BYTES) -> np.ndarray:
+    """ Read a (time, frequency, ...) HDF5 dataset into memory, in chunk-aligned slabs along time
+
+    Args:
+        dset (h5py.Dataset): Dataset to read, e.g. correlation_matrix/data
+        time_slice (slice): Optional selection along the time axis (default: read all)
+        freq_slice (slice): Optional selection along the frequency axis (default: read all)
+        slab_bytes (int): Approximate size of each read, in bytes (default 64 MiB).
+                          Each slab holds a whole multiple of the chunk length in selected
+                          time samples. Slab boundaries only line up with chunk boundaries
+                          for contiguous selections that start on a chunk boundary.
+
+    Returns:
+        data (np.ndarray): Numpy array with (selected) contents of dataset
+
+    Notes:
+        Data are read with ``read_direct`` into a preallocated array, avoiding the extra
+        copy and per-chunk dispatch overhead of ``dset[:]``. Only the selected hyperslab
+        is read from disk.
+    """
+    t_start, t_stop, t_step = (time_slice or slice(None)).indices(dset.shape[0])
+    f_sel = freq_slice or slice(None)
+    n_time = len(range(t_start, t_stop, t_step))
+    n_freq = len(range(*f_sel.indices(dset.shape[1])))
+
+    data = np.empty((n_time, n_freq) + dset.shape[2:], dtype=dset.dtype)
+    if data.size == 0:
+        return data
+
+    t_chunk = dset.chunks[0] if dset.chunks is not None else 1
+    chunk_row_bytes = t_chunk * data[0].nbytes
+    n_t = t_chunk * max(1, slab_bytes // chunk_row_bytes)
+
+    for i0 in range(0, n_time, n_t):
+        i1 = min(i0 + n_t, n_time)
+        source_sel = np.s_[t_start + i0 * t_step:t_start + i1 * t_step:t_step, f_sel]
+        dset.read_direct(data, source_sel=source_sel, dest_sel=np.s_[i0:i1])
+    return data
+
+
 def hdf5_to_uvx(fn_data: str, telescope_name: str=None,
                yaml_config: str=None, conj: bool=True,
-               from_platform_yaml: bool=False, context: dict=None, provenance: dict=None) -> UVX:
+               from_platform_yaml: bool=False, context: dict=None, provenance: dict=None,
+               time_slice: slice=None, freq_slice: slice=None, load_data: bool=True,
+               locking: bool=None) -> UVX:
     """ Create UV from HDF5 data and config file
 
     Args:
@@ -89,6 +172,18 @@ def hdf5_to_uvx(fn_data: str, telescope_name: str=None,
                         should include 'intent', 'notes', 'observer' and 'date' as keys.
         provenance (dict): Dictionary with additional provenance information to add to
                            the provenance dictionary (which is auto-generated)
+        time_slice (slice): Only load this selection of time integrations (default: load all)
+        freq_slice (slice): Only load this selection of frequency channels (default: load all).
+                            If either slice is set, the (start, stop, step) indices and resulting
+                            data shape are recorded in provenance['input_metadata'] as
+                            'time_slice', 'freq_slice' and 'selected_data_shape'.
+                            Slice steps must be positive, otherwise a ValueError is raised.
+        load_data (bool): Load visibility data (default True). If False, only metadata is
+                          loaded: name, context, origin and provenance are filled in, while
+                          antennas, data, timestamps and phase_center are set to None.
+        locking (bool): HDF5 file locking, passed to h5py.File (default None, i.e. use the
+                        HDF5 default or HDF5_USE_FILE_LOCKING). Set to False to read files
+                        that another process holds open for writing.
 
     Returns:
         uv (UV): A UV dataclass object with xarray datasets
@@ -117,9 +212,15 @@ def hdf5_to_uvx(fn_data: str, telescope_name: str=None,
             channel_id
             channel_width
     """
-    md = load_observation_metadata(fn_data, yaml_config, load_config=telescope_name)
-    with h5py.File(fn_data, mode='r') as h5:
-        data = h5['correlation_matrix']['data']
+    # HDF5 hyperslab selections cannot run backwards
+    for name, sel in (('time_slice', time_slice), ('freq_slice', freq_slice)):
+        if sel is not None and sel.step is not None and sel.step < 1:
+            raise ValueError(f"{name} step must be a positive integer, got {sel.step}")
+
+    # Chunk cache is sized to hold a full slab of chunks, see read_hdf5_data
+    with h5py.File(fn_data, mode='r', locking=locking, **HDF5_READ_KWARGS) as h5:
+        # Pass open file handle to avoid opening the file twice
+        md = load_observation_metadata(h5, yaml_config, load_config=telescope_name)
 
         if from_platform_yaml:
             eloc, antpos = station_location_from_platform_yaml(md['antenna_locations_file'])
@@ -127,20 +228,69 @@ def hdf5_to_uvx(fn_data: str, telescope_name: str=None,
         else:
             # Telescope location
             # Also instantiate an EarthLocation observer for LST / Zenith calcs
-            xyz = np.array(list(md[f'telescope_ECEF_{q}'] for q in ('X', 'Y', 'Z')))
-            eloc = EarthLocation.from_geocentric(*xyz, unit='m')
+            eloc = EarthLocation.from_geocentric(md['telescope_ECEF_X'], md['telescope_ECEF_Y'],
+                                                 md['telescope_ECEF_Z'], unit='m')
 
             # Load baselines and antenna locations (ENU)
-            antpos = pd.read_csv(md['antenna_locations_file'], delimiter=' ')
+            antpos = read_antenna_locations(md['antenna_locations_file'])
+
+        # Create empty provenance dictionary if not passed, then fill with creation info
+        provenance = create_empty_provenance_dict() if provenance is None else provenance
+        provenance.update({'input_files': {
+                            'data_filename': os.path.abspath(fn_data),
+                            'config_filename': md['station_config_file'],
+                            },
+                    'aa_uv_config': get_software_versions(),
+                    'input_metadata': md})
+
+        # Include observation_info attributes, which includes firmware and software versions
+        if 'observation_info' in h5.keys():
+            # Read all attributes at once, rather than looking each up from the file
+            obs_info = dict(h5['observation_info'].attrs)
+            try:
+                provenance['station_config'] = {
+                    'observation_description':       obs_info['description'],
+                    'tpm_firmware_version':          obs_info['firmware_version'],
+                    'daq_software_version':          obs_info['software_version'],
+                    'station_config_yaml':           obs_info['station_config']
+                }
+            except KeyError:
+                logger.warning("Could not find expected keys in observation_info")
+                logger.warning(f"{list(obs_info.keys())}")
+
+        # Create empty context dictionary if not passed
+        context_dict = create_empty_context_dict() if context is None else context
+
+        # Metadata only: skip loading data and the (slow) time, antenna and phase center setup
+        if not load_data:
+            return UVX(name=md['telescope_name'], antennas=None, context=context_dict, data=None,
+                       timestamps=None, origin=eloc, phase_center=None, provenance=provenance)
+
+        data = read_hdf5_data(h5['correlation_matrix']['data'], time_slice, freq_slice)
+
+        # input_metadata describes the whole input file, so also record which part was loaded
+        if time_slice is not None or freq_slice is not None:
+            md['time_slice'] = (time_slice or slice(None)).indices(md['data_shape'][0])
+            md['freq_slice'] = (freq_slice or slice(None)).indices(md['data_shape'][1])
+            md['selected_data_shape'] = data.shape
 
         # Generate time - note addition of ts/2 to move to center of integration
-        t     = Time(np.arange(md['n_integrations'], dtype='float64') * md['tsamp'] + md['ts_start'] +  md['tsamp']/2,
-                    format='unix', location=eloc)
-        f_arr = (np.arange(md['n_chans'], dtype='float64') + 1) * md['channel_spacing'] * md['channel_id']
-        f     = Quantity(f_arr, unit='Hz')
+        # Offsets and scale factors are combined first, so each axis is built in place in one pass
+        t_arr = np.arange(md['n_integrations'], dtype='float64')[time_slice or slice(None)]
+        t_arr *= md['tsamp']
+        t_arr += md['ts_start'] + md['tsamp'] / 2
+        t     = Time(t_arr, format='unix', location=eloc)
+        f_arr = np.arange(1, md['n_chans'] + 1, dtype='float64')[freq_slice or slice(None)]
+        f_arr *= md['channel_spacing'] * md['channel_id']
+        f     = Quantity(f_arr, unit='Hz', copy=False)
+
+        # Conjugate in place: data is a freshly-read buffer, so avoid allocating a second copy
+        if conj:
+            logger.info('Conjugating data')
+            np.conjugate(data, out=data)
 
         antennas = create_antenna_data_array(antpos, eloc)
-        data     = create_visibility_array(data, f, t, eloc, conj=conj)
+        data     = create_visibility_array(data, f, t, eloc, conj=False)
         data.attrs['unit'] = md['vis_units']
 
         # Add extra info about time resolution and frequency resolution from input metadata
@@ -156,35 +306,8 @@ def hdf5_to_uvx(fn_data: str, telescope_name: str=None,
         if md['channel_width'] > md['channel_spacing']:
             data.frequency.attrs['oversampled'] = True
 
-        # Create empty provenance dictionary if not passed, then fill with creation info
-        provenance = create_empty_provenance_dict() if provenance is None else provenance
-        provenance.update({'input_files': {
-                            'data_filename': os.path.abspath(fn_data),
-                            'config_filename': md['station_config_file'],
-                            },
-                    'aa_uv_config': get_software_versions(),
-                    'input_metadata': md})
-
-        # Include observation_info attributes, which includes firmware and software versions
-        if 'observation_info' in h5.keys():
-            try:
-                provenance['station_config'] = {
-                    'observation_description':       h5['observation_info'].attrs['description'],
-                    'tpm_firmware_version':          h5['observation_info'].attrs['firmware_version'],
-                    'daq_software_version':          h5['observation_info'].attrs['software_version'],
-                    'station_config_yaml':           h5['observation_info'].attrs['station_config']
-                }
-            except:
-                logger.warning("Could not find expected keys in observation_info")
-                obs_info_keys = h5['observation_info'].keys()
-                logger.warning(f"{obs_info_keys}")
-
         # Compute zenith RA/DEC for phase center
-        zen_aa = AltAz(alt=Angle(90, unit='degree'), az=Angle(0, unit='degree'), obstime=t[0], location=t.location)
-        zen_sc = SkyCoord(zen_aa).icrs
-
-        # Create empty context dictionary if not passed
-        context_dict = create_empty_context_dict() if context is None else context
+        zen_sc = calc_zenith_icrs(t[0], eloc)
 
         # Create UV object
         uv = UVX(name=md['telescope_name'],
@@ -198,3 +321,45 @@ def hdf5_to_uvx(fn_data: str, telescope_name: str=None,
                 )
 
         return uv
+
+
+def _hdf5_to_uvx_worker(fn_data: str, fn_out: str=None, **kwargs):
+    """ Convert a single file, for use by hdf5_to_uvx_many (runs inside a worker process) """
+    uv = hdf5_to_uvx(fn_data, **kwargs)
+    if fn_out is None:
+        return uv
+    write_uvx(uv, fn_out)
+    return fn_out
+
+
+def hdf5_to_uvx_many(filelist: list, filelist_out: list=None, n_workers: int=None, **kwargs) -> list:
+    """ Convert multiple HDF5 files to UVX in parallel, one file per worker process
+
+    Args:
+        filelist (list): List of paths to HDF5 data files
+        filelist_out (list): Optional list of output UVX filenames. If set, each worker
+                             writes its UVX to disk and returns the output filename,
+                             instead of returning the UVX object to the parent process.
+        n_workers (int): Number of worker processes. Defaults to None, i.e. use all cores.
+        **kwargs: Keyword arguments passed to hdf5_to_uvx (e.g. telescope_name, conj).
+                  HDF5 file locking is disabled (locking=False) unless set here.
+
+    Returns:
+        uv_list (list): List of UVX objects (or output filenames if filelist_out is set),
+                        in the same order as filelist.
+
+    Notes:
+        This is multi-file parallelism: each file is opened by a single process. Parallel
+        reads of the *same* file (e.g. ``h5py.File(..., driver='mpio')``) are not used.
+    """
+    if filelist_out is None:
+        filelist_out = [None] * len(filelist)
+    if len(filelist_out) != len(filelist):
+        raise ValueError("filelist and filelist_out must have the same length")
+
+    # Each worker reads a different file, so HDF5 file locking is not needed
+    kwargs.setdefault('locking', False)
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [pool.submit(_hdf5_to_uvx_worker, fn_in, fn_out, **kwargs)
+                   for fn_in, fn_out in zip(filelist, filelist_out)]
+        return [f.result() for f in futures]
@@ -12,40 +12,66 @@ from aa_uv.utils import get_resource_path, load_yaml
 import aa_uv
 
 
-def write_uvx(uv: UVX, filename: str):
+def _compute_chunks(shape: tuple, itemsize: int, target_bytes: int=1<<20) -> tuple:
+    """ Compute a HDF5 chunk shape for a (time, ...) data array
+
+    Chunks start as a single full plane per timestep, e.g. (1, N_freq, N_bl, N_pol).
+    If this exceeds target_bytes, the slowest-varying non-time axes are halved
+    until it fits (the last axis is never split). If a plane is smaller than
+    target_bytes, multiple timesteps are grouped into each chunk.
+
+    Args:
+        shape (tuple): Shape of the data array, time axis first
+        itemsize (int): Size of each data element, in bytes
+        target_bytes (int): Target chunk size in bytes (default 1 MiB)
+
+    Returns:
+        chunks (tuple): Chunk shape to pass to h5py create_dataset
+    """
+    chunks = [1] + list(shape[1:])
+    for ax in range(1, len(chunks) - 1):
+        while chunks[ax] > 1 and np.prod(chunks) * itemsize > target_bytes:
+            chunks[ax] = int(np.ceil(chunks[ax] / 2))
+
+    plane_bytes = np.prod(chunks) * itemsize
+    chunks[0] = int(min(shape[0], max(1, target_bytes // plane_bytes)))
+    return tuple(chunks)
+
+
+def write_uvx(uv: UVX, filename: str, compression: str=None, libver: str=None):
     """ Write a aavs UV object to a HDF5 file
 
     Args:
         uv (UVX): aa_uv.datamodel.UV object
         filename (str): name of output file
+        compression (str): Compression filter to apply to visibility data, e.g. 'lzf'
+                           or 'gzip'. Default None (no compression).
+        libver (str): HDF5 library version bounds, passed to h5py.File. Set to 'latest'
+                      to use newer file format features (files will not be readable
+                      with HDF5 < 1.10). Default None (h5py default, most compatible).
     """
     # Load UVX schema from YAML. We can use this to load descriptions
     # And other metadata from the schema (e.g. dimensions)
     uvx_schema = load_yaml(get_resource_path('datamodel/uvx.yaml'))
 
-    def _str2bytes(darr):
-        if 'U' in str(darr.dtype) or 'obj' in str(darr.dtype):
-            return darr.astype('bytes')
-        else:
-            return darr
-
     def _set_attrs(dobj, dset):
-        for k, v in dobj.attrs.items():
-            try:
-                dset.attrs[k] = v
-            except TypeError:
-                dset.attrs[k] = v.astype('bytes')
-
-    def _create_dset(group, name, dobj):
-        data = _str2bytes(dobj.values)
-        dset = group.create_dataset(name, data=data)
+        # Convert unicode/object string arrays (no HDF5 equivalent) to bytes up front
+        attrs = {k: v.astype('bytes') if isinstance(v, np.ndarray) and v.dtype.kind in 'UO' else v
+                 for k, v in dobj.attrs.items()}
+        dset.attrs.update(attrs)
+
+    def _create_dset(group, name, dobj, chunks=None, **kwargs):
+        data = dobj.values
+        if data.dtype.kind in 'UO':
+            # Write strings as variable-length UTF-8, avoiding a per-element encode
+            dset = group.create_dataset(name, data=data.astype('object'), dtype=h5py.string_dtype())
+        else:
+            dset = group.create_dataset(name, data=data, chunks=chunks, **kwargs)
         _set_attrs(dobj, dset)
 
-    with h5py.File(filename, mode='w') as h:
+    with h5py.File(filename, mode='w', libver=libver) as h:
         # Basic metadata
-        h.attrs['CLASS'] = 'aa_uv'
-        h.attrs['VERSION'] = aa_uv.__version__
-        h.attrs['name'] = uv.name
+        h.attrs.update({'CLASS': 'aa_uv', 'VERSION': aa_uv.__version__, 'name': uv.name})
 
         ####################
         # VISIBILITY GROUP #
@@ -54,8 +80,10 @@ def write_uvx(uv: UVX, filename: str):
         g_vis_c = g_vis.create_group('coords')
         g_vis_a = g_vis.create_group('attrs')
 
-        _create_dset(g_vis, 'data', uv.data)
-        dims = ('time', 'frequency', 'baseline', 'polarization')
+        # Chunk visibilities to match per-timestep access (time, frequency, baseline, pol)
+        vis_chunks = _compute_chunks(uv.data.shape, uv.data.dtype.itemsize)
+        vis_filters = {'compression': compression, 'shuffle': True} if compression else {}
+        _create_dset(g_vis, 'data', uv.data, chunks=vis_chunks, **vis_filters)
 
         # Time
         g_vis_time = g_vis['coords'].create_group('time')
@@ -111,8 +139,7 @@ def write_uvx(uv: UVX, filename: str):
         for k, v in uv.provenance.items():
             if isinstance(v, dict):
                 g_prov_a = g_prov.create_group(k)
-                for sk, sv in v.items():
-                    g_prov_a.attrs[sk] = sv
+                g_prov_a.attrs.update(v)
             else:
                 g_prov.attrs[k] = v
 
@@ -120,45 +147,78 @@ def write_uvx(uv: UVX, filename: str):
         for k, v in uv.context.items():
             if isinstance(v, dict):
                 g_cont_a = g_cont.create_group(k)
-                for sk, sv in v.items():
-                    g_cont_a.attrs[sk] = sv
+                g_cont_a.attrs.update(v)
             else:
                 g_cont.attrs[k] = v
 
         # add metadata about phasing (or lack of)
-        h['phase_center'].attrs['phase_type']  = 'drift'  # pyuvdata defines 'drift' or 'phased'
-        h['phase_center'].attrs['source_name'] = 'zenith'
+        g_pc.attrs.update({'phase_type': 'drift',   # pyuvdata defines 'drift' or 'phased'
+                           'source_name': 'zenith'})
         h['visibilities'].attrs['phase_center_tracking_applied'] = False
 
         # Add descriptions from uvx.yaml schema
         for k, v in uvx_schema.items():
             k = k.replace('uvx/', '') # Strip uvx/ prefix to get hdf5 path
             if k in h.keys():
+                schema_attrs = {}
                 if 'description' in v.keys():
-                    h[k].attrs['description'] = v['description']
+                    schema_attrs['description'] = v['description']
                 if 'dims' in v.keys():
                     # Convert dims into a string
-                    h[k].attrs['dims'] = str(tuple(v['dims']))
+                    schema_attrs['dims'] = str(tuple(v['dims']))
+                h[k].attrs.update(schema_attrs)
             else:
                 logger.warning(f"Could not find {k} in HDF5 file: {list(h.keys())}")
 
 
-def read_uvx(filename: str) -> UVX:
+def read_uvx(filename: str, time_slice: slice=None, rdcc_nbytes: int=256 * 1024**2,
+             rdcc_nslots: int=1_000_003, rdcc_w0: float=0.75) -> UVX:
     """ Load aa_uv UVX object from uvx (HDF5) file
 
     Args:
         filename (str): path to uvx file, or h5py.File
+        time_slice (slice): Only read the given range of timesteps, e.g. slice(0, 10).
+                            Default None (read all timesteps). The step must be positive,
+                            otherwise a ValueError is raised.
+        rdcc_nbytes (int): HDF5 chunk cache size, in bytes (default 256 MiB).
+        rdcc_nslots (int): Number of chunk cache hash slots (default 1000003).
+        rdcc_w0 (float): Chunk cache eviction policy, between 0 and 1 (default 0.75).
+                         Chunk cache settings are ignored if filename is a h5py.File.
 
     Returns:
         uv (aa_uv.datamodel.UV): UV object
+
+    Notes:
+        When time_slice is set, only the HDF5 chunks that overlap the requested
+        timesteps are read from disk. The (start, stop, step) indices and resulting
+        data shape are recorded in provenance['input_metadata'] as 'time_slice' and
+        'selected_data_shape'. If the file already holds a time selection, the indices
+        are given relative to the original input data.
     """
+    # HDF5 hyperslab selections cannot run backwards
+    if time_slice is not None and time_slice.step is not None and time_slice.step < 1:
+        raise ValueError(f"time_slice step must be a positive integer, got {time_slice.step}")
+
     def _to_list(lstr):
         return [x.strip("'").strip() for x in lstr.strip('()[]').split(', ')]
 
+    def _read_dset(dset, time_slice=None):
+        # Read dataset into a preallocated array with a single read_direct call,
+        # avoiding h5py's per-chunk __getitem__ dispatch
+        if time_slice is None:
+            buf = np.empty(dset.shape, dtype=dset.dtype)
+            dset.read_direct(buf)
+        else:
+            n_t = len(range(*time_slice.indices(dset.shape[0])))
+            buf = np.empty((n_t,) + dset.shape[1:], dtype=dset.dtype)
+            dset.read_direct(buf, source_sel=np.s_[time_slice])
+        return buf
+
     if isinstance(filename, h5py.File):
         fh = filename
     else:
-        fh = h5py.File(filename, mode='r')
+        fh = h5py.File(filename, mode='r', rdcc_nbytes=rdcc_nbytes,
+                       rdcc_nslots=rdcc_nslots, rdcc_w0=rdcc_w0)
 
     with fh as h:
 
@@ -167,16 +227,16 @@ def read_uvx(filename: str) -> UVX:
         ################
         coords = {
             'antenna': h['antennas']['coords']['antenna'][:],
-            'spatial': h['antennas']['coords']['spatial'][:].astype('str')
+            'spatial': h['antennas']['coords']['spatial'].asstr()[:].astype('str')
             }
 
         data_vars = {
-        'enu': xp.DataArray(h['antennas']['enu'],
+        'enu': xp.DataArray(_read_dset(h['antennas']['enu']),
                dims=_to_list(h['antennas']['enu'].attrs['dims']),
                attrs=dict(h['antennas']['enu'].attrs.items()),
                coords=coords
                ),
-        'ecef': xp.DataArray(h['antennas']['ecef'],
+        'ecef': xp.DataArray(_read_dset(h['antennas']['ecef']),
                dims=_to_list(h['antennas']['ecef'].attrs['dims']),
                attrs=dict(h['antennas']['ecef'].attrs.items()),
                coords=coords
@@ -184,7 +244,7 @@ def read_uvx(filename: str) -> UVX:
         }
 
         attrs = {
-            'identifier': xp.DataArray(h['antennas/attrs/identifier'][:].astype('str'),
+            'identifier': xp.DataArray(h['antennas/attrs/identifier'].asstr()[:].astype('str'),
                                     dims=('antenna'),
                                     attrs=dict(h['antennas/attrs/identifier'].attrs.items())
                                     ),
@@ -212,9 +272,9 @@ def read_uvx(filename: str) -> UVX:
         ################
 
         # Coordinate - time
-        mjd  = h['visibilities/coords/time/mjd'][:]
-        lst  = h['visibilities/coords/time/lst'][:]
-        unix = h['visibilities/coords/time/unix'][:]
+        mjd  = _read_dset(h['visibilities/coords/time/mjd'], time_slice)
+        lst  = _read_dset(h['visibilities/coords/time/lst'], time_slice)
+        unix = _read_dset(h['visibilities/coords/time/unix'], time_slice)
         t_coord = pd.MultiIndex.from_arrays((mjd, lst, unix), names=('mjd', 'lst', 'unix'))
 
         # Coordinate - baseline
@@ -223,10 +283,10 @@ def read_uvx(filename: str) -> UVX:
             names=('ant1', 'ant2'))
 
         # Coordinate - polarization
-        pol_coord = h['visibilities/coords/polarization'][:].astype('str')
+        pol_coord = h['visibilities/coords/polarization'].asstr()[:].astype('str')
 
         # Coordinate - frequency
-        f_center  = h['visibilities/coords/frequency'][:]
+        f_center  = _read_dset(h['visibilities/coords/frequency'])
         f_coord   = xp.DataArray(f_center, dims=('frequency',),
                                 attrs=dict(h['visibilities/coords/frequency'].attrs.items()))
 
@@ -237,7 +297,7 @@ def read_uvx(filename: str) -> UVX:
             'frequency': f_coord
         }
 
-        vis = xp.DataArray(h['visibilities']['data'],
+        vis = xp.DataArray(_read_dset(h['visibilities']['data'], time_slice),
                         coords=coords,
                         dims=_to_list(h['visibilities']['data'].attrs['dims']),
                         attrs=attrs
@@ -264,6 +324,16 @@ def read_uvx(filename: str) -> UVX:
         for k, v in h['provenance'].items():
             provenance[k] = dict(v.attrs.items())
 
+        if time_slice is not None:
+            t_start, t_stop, t_step = time_slice.indices(h['visibilities']['data'].shape[0])
+            input_md = provenance.setdefault('input_metadata', {})
+            if 'time_slice' in input_md:
+                # Map indices back onto the input data the file was created from
+                t0, _, dt0 = (int(x) for x in input_md['time_slice'])
+                t_start, t_stop, t_step = t0 + t_start * dt0, t0 + t_stop * dt0, t_step * dt0
+            input_md['time_slice'] = (t_start, t_stop, t_step)
+            input_md['selected_data_shape'] = vis.shape
+
         context = dict(h['context'].attrs.items())
         for k, v in h['context'].items():
             context[k] = dict(v.attrs.items())
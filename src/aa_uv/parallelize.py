@@ -25,7 +25,7 @@ def run_in_parallel(task_list: list, n_workers: int=-1, show_progressbar=True, b
         task_list (list): A list of tasks (using @parallelize.task 'delayed' lazy loading)
         n_workers (int): Number of workers to use. Defaults to -1, i.e. use all cores.
         show_progressbar (bool): Show tqdm progress bar (default True)
-        backend (str): Parallel processing backend, one of 'loky' (default) or 'dask'
+        backend (str): Parallel processing backend, one of 'loky' (default), 'threading' or 'dask'
 
     Example usage:
         ::
@@ -42,7 +42,18 @@ def run_in_parallel(task_list: list, n_workers: int=-1, show_progressbar=True, b
 
             run_in_parallel(task_list, n_workers=8)
 
+    Notes:
+        The 'threading' backend avoids process startup and pickling of task arguments.
+        h5py and NumPy release the GIL during file I/O and most array operations, so
+        threads can scale well for I/O-bound tasks (e.g. HDF5 to HDF5 conversion).
+        Tasks dominated by pure-Python work (e.g. astropy coordinate setup) will
+        scale better with the process-based 'loky' backend.
     """
+    if backend == 'threading':
+        level = "INFO" if verbose else "WARNING"
+        logger = reset_logger(use_tqdm=True, level=level)
+        return Parallel(n_jobs=n_workers, prefer='threads')(tqdm.tqdm(task_list))
+
     if backend == 'dask':
         from dask.distributed import LocalCluster
         cluster = LocalCluster(n_workers=n_workers, threads_per_worker=1)
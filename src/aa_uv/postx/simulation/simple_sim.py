@@ -1,34 +1,70 @@
 from __future__ import annotations
 import typing
+from functools import lru_cache
 if typing.TYPE_CHECKING:
     from ..aperture_array import ApertureArray
 import numpy as np
 from astropy.constants import c
 import xarray as xr
 
+from aa_uv.utils import import_optional_dependency
+
 LIGHT_SPEED = c.to('m/s').value
 cos, sin = np.cos, np.sin
 
-def simulate_visibilities_pointsrc(ant_arr: ApertureArray, sky_model: dict):
+
+@lru_cache(maxsize=1)
+def _get_accumulate_outer_jit():
+    """ Return the numba-compiled outer product kernel (numba is imported on first use) """
+    numba = import_optional_dependency('numba')
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _accumulate_outer(phsmat: np.ndarray, phases: np.ndarray, weights: np.ndarray):
+        """ Accumulate weighted outer products of phase vectors into phsmat (in place)
+
+        Args:
+            phsmat (np.array): Output matrix to accumulate into, (Nant, Nant)
+            phases (np.array): Per-source phase vectors, (Nsrc, Nant)
+            weights (np.array): Per-source weights, (Nsrc)
+        """
+        n_src, n_ant = phases.shape
+        for ii in numba.prange(n_ant):
+            for ss in range(n_src):
+                a = weights[ss] * phases[ss, ii]
+                for jj in range(n_ant):
+                    phsmat[ii, jj] += a * np.conj(phases[ss, jj])
+
+    return _accumulate_outer
+
+
+def simulate_visibilities_pointsrc(ant_arr: ApertureArray, sky_model: dict, use_numba: bool=False):
     """ Simulate model visibilities for an antenna array
 
     Args:
         ant_arr (AntArray): Antenna array to use
         sky_model (dict): Sky model to use
+        use_numba (bool): Accumulate outer products with a numba kernel (requires numba),
+                          instead of a single matrix multiply. Default False.
 
     Returns:
         model_vis_matrix (np.array): Model visibilities that should be expected given the known applied delays, (Nchan, Nant, Nant)
     """
-    phsmat = None
+    phs_list, weights = [], []
     for srcname, src in sky_model.items():
-        phs = ant_arr.coords.generate_phase_vector(src, conj=True).squeeze()
-        if hasattr(src, "mag"):
-            phs *= src.mag / np.sqrt(2)
-
-        if phsmat is None:
-            phsmat = np.outer(phs, np.conj(phs))
-        else:
-            phsmat += np.outer(phs, np.conj(phs))
+        phs_list.append(ant_arr.coords.generate_phase_vector(src, conj=True).ravel())
+        weights.append(src.mag**2 / 2 if hasattr(src, "mag") else 1.0)
+
+    if use_numba:
+        accumulate_outer = _get_accumulate_outer_jit()
+        phases  = np.stack(phs_list, axis=0)
+        phsmat  = np.zeros((phases.shape[1], phases.shape[1]), dtype=phases.dtype)
+        accumulate_outer(phsmat, phases, np.array(weights, dtype=phases.real.dtype))
+    else:
+        # Stack per-source phase vectors (scaled by sqrt of weight) into columns of P,
+        # shape (Nant, Nsrc), then sum outer products as a single matrix multiply
+        P = np.stack(phs_list, axis=1)
+        P *= np.sqrt(np.array(weights, dtype=P.real.dtype))
+        phsmat = P @ P.conj().T
 
     # Convert to 4-pol
     v0 = np.zeros_like(phsmat)
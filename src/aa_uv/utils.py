@@ -4,9 +4,17 @@ from loguru import logger
 import sys
 from tqdm import tqdm
 import shutil
+import zipfile
 import yaml
 import types, typing
 import importlib
+import functools
+import copy
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError: # pragma: no cover
+    from yaml import SafeLoader as YamlLoader
 
 def reset_logger(use_tqdm: bool=False, disable: bool=False, level: str="INFO", *args, **kwargs) -> logger:
     """ Reset loguru logger and setup output format
@@ -45,17 +53,27 @@ def reset_logger(use_tqdm: bool=False, disable: bool=False, level: str="INFO", *
 
 def load_yaml(filename: str) -> dict:
     """ Read YAML file into a Python dict """
-    d = yaml.load(open(filename, 'r'), yaml.Loader)
+    with open(filename, 'r') as fh:
+        d = yaml.load(fh, YamlLoader)
     return d
 
 
-def load_config(telescope_name: str) -> dict:
-    """ Load internal array configuration by telescope name """
+@functools.lru_cache(maxsize=None)
+def _load_config(telescope_name: str) -> dict:
     yaml_path = get_config_path(telescope_name)
-    d = load_yaml(yaml_path)
-    return d
+    return load_yaml(yaml_path)
+
+
+def load_config(telescope_name: str) -> dict:
+    """ Load internal array configuration by telescope name
 
+    Notes:
+        Parsed configs are cached; a copy is returned so callers may modify it.
+    """
+    return copy.deepcopy(_load_config(telescope_name))
 
+
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path: str) -> str:
     """ Get the path to an internal package resource (e.g. data file)
 
@@ -75,6 +93,7 @@ def get_resource_path(relative_path: str) -> str:
     return abs_path
 
 
+@functools.lru_cache(maxsize=None)
 def get_config_path(name: str) -> str:
     """ Get path to internal array configuration by telescope name
 
@@ -90,8 +109,8 @@ def get_config_path(name: str) -> str:
     return get_resource_path(relative_path)
 
 
-def get_software_versions() -> dict:
-    """ Return version of main software packages """
+@functools.lru_cache(maxsize=1)
+def _get_software_versions() -> dict:
     from aa_uv import __version__ as aa_uv_version
     from astropy import __version__ as astropy_version
     from numpy import __version__ as numpy_version
@@ -114,14 +133,36 @@ def get_software_versions() -> dict:
     return software
 
 
-def zipit(dirname: str, rm_dir: bool=False):
+def get_software_versions() -> dict:
+    """ Return version of main software packages
+
+    Notes:
+        Versions are looked up once and cached; a copy is returned so callers may modify it.
+    """
+    return dict(_get_software_versions())
+
+
+def zipit(dirname: str, rm_dir: bool=False, compress: bool=False):
     """ Zip up a directory
 
     Args:
         dirname (str): Name of directory to zip
         rm_dir (bool): Delete directory after zipping (default False)
+        compress (bool): Apply fast (level 1) DEFLATE compression. Default False, files
+                         are stored uncompressed, as output data rarely compresses well.
     """
-    shutil.make_archive(dirname, format='zip', root_dir='.', base_dir=dirname)
+    if compress:
+        zip_kwargs = {'compression': zipfile.ZIP_DEFLATED, 'compresslevel': 1}
+    else:
+        zip_kwargs = {'compression': zipfile.ZIP_STORED}
+
+    with zipfile.ZipFile(f"{dirname}.zip", 'w', **zip_kwargs) as zf:
+        for root, dirs, files in os.walk(dirname):
+            zf.write(root, arcname=os.path.normpath(root))
+            for fn in files:
+                path = os.path.join(root, fn)
+                zf.write(path, arcname=os.path.normpath(path))
+
     if rm_dir:
         shutil.rmtree(dirname)
 
@@ -1,10 +1,82 @@
+from __future__ import annotations
+import typing
+if typing.TYPE_CHECKING:
+    from aa_uv.datamodel import UVX
+
+from functools import lru_cache
+
 import numpy as np
 from pyuvdata import utils as uvutils
 
-from aa_uv.datamodel import UVX
 from astropy.constants import c
+from astropy.coordinates import AltAz, Angle, EarthLocation, SkyCoord
+from astropy.time import Time, TimeDelta
 LIGHT_SPEED = c.value
 
+
+@lru_cache(maxsize=128)
+def _zenith_icrs_radec(jd1: float, jd2: float, scale: str, x_m: float, y_m: float, z_m: float) -> tuple[float, float]:
+    """ Cached AltAz -> ICRS transform of zenith, returning (ra, dec) in radians """
+    t0 = Time(jd1, jd2, format='jd', scale=scale)
+    eloc = EarthLocation.from_geocentric(x_m, y_m, z_m, unit='m')
+    zen_aa = AltAz(alt=Angle(90, unit='degree'), az=Angle(0, unit='degree'), obstime=t0, location=eloc)
+    zen_icrs = SkyCoord(zen_aa).icrs
+    return zen_icrs.ra.to_value('rad'), zen_icrs.dec.to_value('rad')
+
+
+def calc_zenith_icrs(t0: Time, eloc: EarthLocation) -> SkyCoord:
+    """ Calculate the ICRS coordinates of the zenith, for a given time and location
+
+    Args:
+        t0 (Time): Astropy Time (scalar) at which to compute zenith
+        eloc (EarthLocation): Observer location
+
+    Returns:
+        zen_sc (SkyCoord): ICRS SkyCoord of the zenith
+
+    Notes:
+        The AltAz -> ICRS transform is slow, so results are cached on the exact
+        time and location. A new SkyCoord is returned on each call.
+    """
+    x_m, y_m, z_m = (float(q.to_value('m')) for q in eloc.geocentric)
+    ra, dec = _zenith_icrs_radec(float(t0.jd1), float(t0.jd2), t0.scale, x_m, y_m, z_m)
+    return SkyCoord(ra, dec, unit='rad', frame='icrs')
+
+
+def calc_apparent_lst(t: Time, precision: float=600) -> np.ndarray:
+    """ Calculate apparent local sidereal time, in radians
+
+    Args:
+        t (Time): Astropy Time array, with location set
+        precision (float): Spacing of the coarse time grid used for the slowly-varying
+                           terms, in seconds (default 600)
+
+    Returns:
+        lst_rad (np.ndarray): Apparent LST for each timestamp, in radians
+
+    Notes:
+        Apparent sidereal time is the Earth rotation angle (ERA) plus slowly-varying
+        precession-nutation terms. ERA is cheap and computed for every timestamp, while
+        (LST - ERA) is computed on a coarse grid and linearly interpolated. For spans
+        shorter than ``precision``, ``t.sidereal_time('apparent')`` is used directly.
+    """
+    dt_sec = (t - t.min()).to_value('s') if not t.isscalar else 0
+    if t.isscalar or dt_sec.max() <= precision:
+        return t.sidereal_time('apparent').to_value('rad')
+
+    n_grid = int(np.ceil(dt_sec.max() / precision)) + 1
+    grid_sec = np.linspace(0, dt_sec.max(), n_grid)
+    t_grid = Time(t.min() + TimeDelta(grid_sec, format='sec'), location=t.location)
+
+    # Difference (LST - ERA), wrapped to (-pi, pi]
+    d_grid = t_grid.sidereal_time('apparent').to_value('rad') - t_grid.earth_rotation_angle().to_value('rad')
+    d_grid = np.angle(np.exp(1j * d_grid))
+
+    era = t.earth_rotation_angle().to_value('rad')
+    lst_rad = np.mod(era + np.interp(dt_sec, grid_sec, d_grid), 2 * np.pi)
+    return lst_rad
+
+
 def calc_zenith_apparent_coords(uv: UVX) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """ Calculate the apparent RA/DEC coordinates of the array zenith
 
@@ -25,8 +97,8 @@ def calc_zenith_apparent_coords(uv: UVX) -> tuple[np.ndarray, np.ndarray, np.nda
     """
     app_ras, app_decs = uvutils.transform_icrs_to_app(
         uv.timestamps,
-        uv.phase_center.ra.to('rad').value,
-        uv.phase_center.dec.to('rad').value,
+        uv.phase_center.ra.to_value('rad'),
+        uv.phase_center.dec.to_value('rad'),
         telescope_loc=uv.origin,
         epoch=2000.0,
         pm_ra=None,
@@ -71,6 +143,7 @@ def calc_uvw(uv: UVX) -> np.ndarray:
 
     # Get LST in radians
     lst_rad = (uv.data.time.lst / 12 * np.pi).values
+    geodetic = uv.origin.to_geodetic()
 
     # Compute apparent RA and DECs, and frame position angle
     app_ras, app_decs, frame_pos_angle = calc_zenith_apparent_coords(uv)
@@ -86,8 +159,8 @@ def calc_uvw(uv: UVX) -> np.ndarray:
         antenna_numbers=uv.antennas.coords['antenna'].values,
         ant_1_array=np.tile(uv.data.ant1.values, n_ts),
         ant_2_array=np.tile(uv.data.ant2.values, n_ts),
-        telescope_lat=uv.origin.to_geodetic().lat.to('rad').value,
-        telescope_lon=uv.origin.to_geodetic().lon.to('rad').value,
+        telescope_lat=geodetic.lat.to_value('rad'),
+        telescope_lon=geodetic.lon.to_value('rad'),
     )
 
     return uvw.reshape((n_ts, n_bl, 3))
@@ -115,6 +188,7 @@ def calc_zenith_tracking_phase_corr(uv: UVX) -> np.ndarray:
 
     # Get LST in radians
     lst_rad = (uv.data.time.lst / 12 * np.pi).values
+    geodetic = uv.origin.to_geodetic()
 
     # Calculate tracked UVW (i.e. standard)
     tracking_uvw = calc_uvw(uv)
@@ -123,8 +197,8 @@ def calc_zenith_tracking_phase_corr(uv: UVX) -> np.ndarray:
     # This differs from tracked as it uses non-apparent position (i.e. J2000)
     # for the phase center and a frame position angle = 0
     non_tracking_uvw = uvutils.calc_uvw(
-        app_ra=np.repeat(uv.phase_center.ra.to('rad').value, n_bl * n_ts),
-        app_dec=np.repeat(uv.phase_center.dec.to('rad').value, n_bl * n_ts),
+        app_ra=np.repeat(uv.phase_center.ra.to_value('rad'), n_bl * n_ts),
+        app_dec=np.repeat(uv.phase_center.dec.to_value('rad'), n_bl * n_ts),
         lst_array=np.repeat(lst_rad, n_bl),
         use_ant_pos=True,
         frame_pa=np.repeat(0, n_bl * n_ts),
@@ -132,8 +206,8 @@ def calc_zenith_tracking_phase_corr(uv: UVX) -> np.ndarray:
         antenna_numbers=uv.antennas.coords['antenna'].values,
         ant_1_array=np.tile(uv.data.ant1.values, n_ts),
         ant_2_array=np.tile(uv.data.ant2.values, n_ts),
-        telescope_lat=uv.origin.to_geodetic().lat.to('rad').value,
-        telescope_lon=uv.origin.to_geodetic().lon.to('rad').value,
+        telescope_lat=geodetic.lat.to_value('rad'),
+        telescope_lon=geodetic.lon.to_value('rad'),
     )
     non_tracking_uvw = non_tracking_uvw.reshape((n_ts, n_bl, 3))
 
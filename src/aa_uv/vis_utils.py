@@ -76,4 +76,25 @@ def vis_arr_to_matrix_4pol(d: np.ndarray, n_ant: int, tri: str='upper', V: np.ar
     if conj:
         V = np.conj(V)
 
-    return V
\ No newline at end of file
+    return V
+
+
+def remap_pols(vis: np.ndarray, pol_perm: tuple, conj: bool=False, dtype: str=None) -> np.ndarray:
+    """ Reorder (and optionally conjugate) the polarization axis in a single pass
+
+    Args:
+        vis (np.ndarray): Visibility array, with polarization as last axis
+        pol_perm (tuple): Input polarization index for each output polarization
+        conj (bool): Conjugate visibility data
+        dtype (str): Output data type, e.g. 'complex64'. Defaults to input dtype.
+
+    Returns:
+        vis_out (np.ndarray): New array with reordered polarization axis
+    """
+    vis_out = np.empty(vis.shape, dtype=vis.dtype if dtype is None else dtype)
+    for p_out, p_in in enumerate(pol_perm):
+        if conj:
+            np.conjugate(vis[..., p_in], out=vis_out[..., p_out], casting='same_kind')
+        else:
+            vis_out[..., p_out] = vis[..., p_in]
+    return vis_out
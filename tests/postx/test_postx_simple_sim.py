@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from types import SimpleNamespace
+
+from aa_uv.postx.simulation.simple_sim import simulate_visibilities_pointsrc
+
+
+def _make_phases(n_src: int, n_ant: int, seed: int=42):
+    rng = np.random.default_rng(seed)
+    phases = np.exp(1j * rng.uniform(0, 2 * np.pi, size=(n_src, n_ant)))
+    weights = rng.uniform(0.5, 2.0, size=n_src)
+    return phases, weights
+
+
+def test_accumulate_outer_jit():
+    """ Compare numba outer-product kernel against a weighted matrix multiply """
+    pytest.importorskip('numba')
+    from aa_uv.postx.simulation.simple_sim import _get_accumulate_outer_jit
+
+    phases, weights = _make_phases(5, 16)
+    phsmat = np.zeros((16, 16), dtype='complex128')
+    _get_accumulate_outer_jit()(phsmat, phases, weights)
+
+    P = phases.T * np.sqrt(weights)
+    assert np.allclose(phsmat, P @ P.conj().T)
+
+
+def test_simulate_visibilities_pointsrc_numba():
+    """ simulate_visibilities_pointsrc: use_numba=True should match the matmul path """
+    pytest.importorskip('numba')
+
+    phases, weights = _make_phases(3, 8)
+    sky_model = {f'src{ii}': SimpleNamespace(idx=ii, mag=np.sqrt(2 * weights[ii])) for ii in range(3)}
+
+    # Minimal stand-in for ApertureArray: only coords.generate_phase_vector is used
+    coords = SimpleNamespace(generate_phase_vector=lambda src, conj=True: phases[src.idx])
+    ant_arr = SimpleNamespace(coords=coords)
+
+    V = simulate_visibilities_pointsrc(ant_arr, sky_model)
+    V_numba = simulate_visibilities_pointsrc(ant_arr, sky_model, use_numba=True)
+    assert V.shape == (1, 1, 8, 8, 4)
+    assert np.allclose(V.values, V_numba.values)
+
+
+if __name__ == "__main__":
+    test_accumulate_outer_jit()
+    test_simulate_visibilities_pointsrc_numba()
@@ -31,10 +31,28 @@ def test_create_arrays():
     data        = create_visibility_array(data, f, t, eloc)
     print(data)
 
+def test_visibility_lst_uses_eloc():
+    md   = load_observation_metadata(FN_DATA, FN_CONFIG)
+    eloc = EarthLocation.from_geocentric(md['telescope_ECEF_X'], md['telescope_ECEF_Y'],
+                                         md['telescope_ECEF_Z'], unit='m')
+    eloc_other = EarthLocation.from_geodetic(0, 0)
+
+    t = Time(np.arange(md['n_integrations'], dtype='float64') * md['tsamp'] + md['ts_start'],
+             format='unix', location=eloc_other)
+    f = Quantity(np.array([md['channel_spacing'] * md['channel_id']]), unit='Hz')
+    data = np.zeros((md['n_integrations'], 1, 32896, 4), dtype='complex64')
+
+    vis = create_visibility_array(data, f, t, eloc)
+    lst_expected = Time(t, location=eloc).sidereal_time('apparent').to_value('hourangle')
+    assert np.allclose(vis.lst.values, lst_expected)
+    # Caller's Time is not modified
+    assert t.location == eloc_other
+
 def test_create_uv():
     aavs = hdf5_to_uvx(FN_DATA, yaml_config=FN_CONFIG)
     print(aavs)
 
 if __name__ == "__main__":
     test_create_arrays()
+    test_visibility_lst_uses_eloc()
     test_create_uv()
\ No newline at end of file
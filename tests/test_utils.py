@@ -1,7 +1,8 @@
-from aa_uv.utils import zipit, import_optional_dependency
+from aa_uv.utils import zipit, import_optional_dependency, get_software_versions
 import numpy as np
 import pytest
 import os, shutil
+import zipfile
 
 
 def test_zipit():
@@ -20,6 +21,15 @@ def test_zipit():
      assert os.path.exists('test-zip.zip')
      assert ~os.path.exists('test-zip')
 
+     with zipfile.ZipFile('test-zip.zip') as zf:
+          assert sorted(zf.namelist()) == ['test-zip/', 'test-zip/hello.txt', 'test-zip/hi.txt']
+          assert all(zi.compress_type == zipfile.ZIP_STORED for zi in zf.infolist())
+     os.remove('test-zip.zip')
+
+     create_dummy_dir()
+     zipit('test-zip', rm_dir=True, compress=True)
+     with zipfile.ZipFile('test-zip.zip') as zf:
+          assert zf.getinfo('test-zip/hi.txt').compress_type == zipfile.ZIP_DEFLATED
      os.remove('test-zip.zip')
 
 
@@ -32,6 +42,13 @@ def test_import_optional_dependency():
      import_optional_dependency('whatimlookingfor', 'ignore')
 
 
+def test_get_software_versions():
+     sw = get_software_versions()
+     assert 'aa_uv' in sw.keys()
+     sw['aa_uv'] = 'modified'
+     assert get_software_versions()['aa_uv'] != 'modified'
+
 if __name__ == "__main__":
     test_zipit()
-    test_import_optional_dependency()
\ No newline at end of file
+    test_import_optional_dependency()
+    test_get_software_versions()
\ No newline at end of file
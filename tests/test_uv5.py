@@ -1,4 +1,13 @@
-from aa_uv.io import hdf5_to_uvx, read_uvx, write_uvx
+from aa_uv.io import hdf5_to_uvx, hdf5_to_uvx_many, read_uvx, write_uvx
+from aa_uv.io.uvx import _compute_chunks
+from aa_uv.io.to_uvx import read_hdf5_data
+import os
+import sys
+import shutil
+import subprocess
+import h5py
+import numpy as np
+import pytest
 
 def test_roundtrip():
 
@@ -37,6 +46,148 @@ def test_roundtrip():
         assert isinstance(uv2.antennas.attrs[k], type(v))
 
 
+def test_chunks():
+    # Large plane: split frequency, then baseline axis, never polarization
+    assert _compute_chunks((10, 32, 32768, 4), 8) == (1, 1, 32768, 4)
+    assert _compute_chunks((10, 1, 65536, 4), 8) == (1, 1, 32768, 4)
+
+    # Small plane: group multiple timesteps per chunk
+    assert _compute_chunks((10, 1, 256, 4), 8) == (10, 1, 256, 4)
+
+    fn = 'test-data/aavs2_2x500ms/correlation_burst_204_20230927_35116_0.hdf5'
+    uv = hdf5_to_uvx(fn, telescope_name='aavs2')
+    write_uvx(uv, 'test.h5', compression='lzf', libver='latest')
+    with h5py.File('test.h5', mode='r') as h:
+        assert h['visibilities/data'].chunks == _compute_chunks(uv.data.shape, uv.data.dtype.itemsize)
+        assert h['visibilities/data'].compression == 'lzf'
+
+    uv2 = read_uvx('test.h5')
+    assert np.allclose(uv.data.values, uv2.data.values)
+
+    # Partial read of timesteps
+    uv3 = read_uvx('test.h5', time_slice=slice(1, 2))
+    assert uv3.data.shape == (1,) + uv.data.shape[1:]
+    assert np.allclose(uv.data.values[1:2], uv3.data.values)
+    assert np.allclose(uv.timestamps.unix[1:2], uv3.timestamps.unix)
+
+    # Selection is recorded in provenance
+    assert 'time_slice' not in uv2.provenance['input_metadata']
+    assert tuple(uv3.provenance['input_metadata']['time_slice']) == (1, 2, 1)
+    assert tuple(uv3.provenance['input_metadata']['selected_data_shape']) == uv3.data.shape
+
+    with pytest.raises(ValueError):
+        read_uvx('test.h5', time_slice=slice(None, None, -1))
+
+
+def test_hdf5_to_uvx_slice():
+    fn = 'test-data/aavs2_2x500ms/correlation_burst_204_20230927_35116_0.hdf5'
+    uv = hdf5_to_uvx(fn, telescope_name='aavs2')
+
+    uv_t = hdf5_to_uvx(fn, telescope_name='aavs2', time_slice=slice(1, 2), freq_slice=slice(0, 1))
+    assert uv_t.data.shape == (1,) + uv.data.shape[1:]
+    assert np.allclose(uv_t.data.values, uv.data.values[1:2])
+    assert np.allclose(uv_t.timestamps.unix, uv.timestamps[1:2].unix)
+    assert np.allclose(uv_t.data.frequency.values, uv.data.frequency.values)
+
+    # Selection is recorded in provenance, and survives a write/read roundtrip
+    md = uv_t.provenance['input_metadata']
+    assert tuple(md['time_slice']) == (1, 2, 1)
+    assert tuple(md['freq_slice']) == (0, 1, 1)
+    assert tuple(md['selected_data_shape']) == uv_t.data.shape
+    assert 'time_slice' not in uv.provenance['input_metadata']
+
+    write_uvx(uv_t, 'test.h5')
+    md2 = read_uvx('test.h5').provenance['input_metadata']
+    assert tuple(md2['selected_data_shape']) == uv_t.data.shape
+
+    # A further selection on read is recorded relative to the original input data
+    md3 = read_uvx('test.h5', time_slice=slice(0, 1)).provenance['input_metadata']
+    assert tuple(md3['time_slice']) == (1, 2, 1)
+
+    # Reversed or zero-step selections are rejected
+    with pytest.raises(ValueError):
+        hdf5_to_uvx(fn, telescope_name='aavs2', time_slice=slice(None, None, -1))
+    with pytest.raises(ValueError):
+        hdf5_to_uvx(fn, telescope_name='aavs2', freq_slice=slice(0, 1, 0))
+
+def test_read_hdf5_data():
+    # Synthetic chunked (time, frequency, baseline, pol) dataset, with a small slab size
+    # so that multiple (and partial) slabs are read
+    shape = (11, 6, 5, 4)
+    d = (np.arange(np.prod(shape)) + 1j * np.arange(np.prod(shape))).reshape(shape).astype('complex64')
+    with h5py.File('test-read.h5', mode='w') as h:
+        h.create_dataset('data', data=d, chunks=(2, 1, 5, 4))
+
+    slab_bytes = 2 * 6 * 5 * 4 * 8
+    selections = [
+        (None, None),
+        (slice(2, 9), None),
+        (slice(1, 10, 3), slice(1, 5)),
+        (slice(None, None, 2), slice(0, 6, 2)),
+        (slice(3, 4), slice(5, 6)),
+        (slice(5, 5), None),
+    ]
+    try:
+        with h5py.File('test-read.h5', mode='r') as h:
+            for time_slice, freq_slice in selections:
+                data = read_hdf5_data(h['data'], time_slice, freq_slice, slab_bytes=slab_bytes)
+                expected = d[time_slice or slice(None)][:, freq_slice or slice(None)]
+                assert data.shape == expected.shape
+                assert np.array_equal(data, expected)
+    finally:
+        os.remove('test-read.h5')
+
+def test_hdf5_to_uvx_metadata_only():
+    fn = 'test-data/aavs2_2x500ms/correlation_burst_204_20230927_35116_0.hdf5'
+    uv = hdf5_to_uvx(fn, telescope_name='aavs2', load_data=False)
+    assert uv.data is None and uv.timestamps is None and uv.phase_center is None
+    assert uv.name == 'aavs2'
+    assert uv.provenance['input_metadata']['n_integrations'] == 2
+
+def test_hdf5_to_uvx_many():
+    fn = 'test-data/aavs2_2x500ms/correlation_burst_204_20230927_35116_0.hdf5'
+    uv = hdf5_to_uvx(fn, telescope_name='aavs2')
+
+    uv_list = hdf5_to_uvx_many([fn, fn], n_workers=2, telescope_name='aavs2')
+    assert len(uv_list) == 2
+    for uv_many in uv_list:
+        assert np.allclose(uv_many.data.values, uv.data.values)
+
+    fn_out = hdf5_to_uvx_many([fn], ['test.h5'], n_workers=1, telescope_name='aavs2')
+    assert fn_out == ['test.h5']
+    assert np.allclose(read_uvx('test.h5').data.values, uv.data.values)
+
+def test_hdf5_to_uvx_many_file_locking():
+    # locking=False should allow reading a file that another process holds open for
+    # writing. hdf5_to_uvx_many workers disable locking by default, without changing
+    # the caller's environment.
+    fn = 'test-data/aavs2_2x500ms/correlation_burst_204_20230927_35116_0.hdf5'
+    fn_lock = 'test-lock.hdf5'
+    shutil.copy(fn, fn_lock)
+    locking_env = os.environ.pop('HDF5_USE_FILE_LOCKING', None)
+    writer = subprocess.Popen([sys.executable, '-c',
+                               "import sys, time, h5py; f = h5py.File(sys.argv[1], mode='r+'); "
+                               "print('locked', flush=True); time.sleep(60)", fn_lock],
+                              stdout=subprocess.PIPE, text=True)
+    try:
+        assert writer.stdout.readline().strip() == 'locked'
+        uv = hdf5_to_uvx(fn_lock, telescope_name='aavs2', locking=False)
+        uv_list = hdf5_to_uvx_many([fn_lock], n_workers=1, telescope_name='aavs2')
+        assert uv.data.shape[0] == 2
+        assert uv_list[0].data.shape[0] == 2
+        assert 'HDF5_USE_FILE_LOCKING' not in os.environ
+    finally:
+        writer.kill()
+        writer.wait()
+        if locking_env is not None:
+            os.environ['HDF5_USE_FILE_LOCKING'] = locking_env
+        os.remove(fn_lock)
 
 if __name__ == "__main__":
-    test_roundtrip()
\ No newline at end of file
+    test_roundtrip()
+    test_chunks()
+    test_hdf5_to_uvx_slice()
+    test_read_hdf5_data()
+    test_hdf5_to_uvx_metadata_only()
+    test_hdf5_to_uvx_many()
+    test_hdf5_to_uvx_many_file_locking()
\ No newline at end of file
@@ -1,7 +1,10 @@
 from aa_uv.io import hdf5_to_uvx, hdf5_to_pyuvdata
-from aa_uv.uvw_utils import calc_uvw
+from aa_uv.uvw_utils import calc_uvw, calc_apparent_lst, calc_zenith_icrs
 import numpy as np
+import astropy.units as u
+from astropy.coordinates import AltAz, Angle, SkyCoord
 from pyuvdata import utils as uvutils
+from aa_uv.datamodel.uvx import _ecef_from_enu_relative
 
 def test_uvw():
     fn = './test-data/aavs2_2x500ms/correlation_burst_204_20230927_35116_0.hdf5'
@@ -80,5 +83,50 @@ def test_uvw():
     uvw_ = calc_uvw(uv)
     assert np.allclose(uvw.reshape((n_ts, n_bl, 3)), uvw_)
 
+def test_calc_apparent_lst():
+    fn = './test-data/aavs2_2x500ms/correlation_burst_204_20230927_35116_0.hdf5'
+    uv = hdf5_to_uvx(fn, telescope_name='aavs2')
+
+    # Short span - computed directly
+    lst = calc_apparent_lst(uv.timestamps)
+    assert np.allclose(lst, uv.timestamps.sidereal_time('apparent').to_value('rad'))
+
+    # Long span (~6 hours) - interpolated
+    t = uv.timestamps[0] + np.arange(0, 6 * 3600, 7) * u.s
+    lst = calc_apparent_lst(t)
+    lst_ref = t.sidereal_time('apparent').to_value('rad')
+    assert np.allclose(np.angle(np.exp(1j * (lst - lst_ref))), 0, atol=1e-9)
+
+def test_calc_zenith_icrs():
+    fn = './test-data/aavs2_2x500ms/correlation_burst_204_20230927_35116_0.hdf5'
+    uv = hdf5_to_uvx(fn, telescope_name='aavs2')
+    t0 = uv.timestamps[0]
+
+    zen_aa = AltAz(alt=Angle(90, unit='degree'), az=Angle(0, unit='degree'), obstime=t0, location=uv.origin)
+    zen_ref = SkyCoord(zen_aa).icrs
+
+    zen_sc = calc_zenith_icrs(t0, uv.origin)
+    assert zen_sc.separation(zen_ref).to_value('arcsec') < 1e-6
+
+    # Second call should be served from cache, but still return a new object
+    zen_sc2 = calc_zenith_icrs(t0, uv.origin)
+    assert zen_sc2 is not zen_sc
+    assert zen_sc2.ra == zen_sc.ra and zen_sc2.dec == zen_sc.dec
+
+def test_ecef_from_enu_relative():
+    # Compare against pyuvdata at sites in both hemispheres and across longitudes.
+    # Tolerance of 1 micron: float64 rounding of ECEF coordinates (~6.4e6 m) is ~1e-9 m
+    rng = np.random.default_rng(1234)
+    enu = rng.uniform(-5000, 5000, size=(64, 3))
+    sites = [(-26.7, 116.7, 377.0), (52.0, -2.0, 50.0), (0.0, 180.0, 0.0), (-60.0, -70.0, 1000.0)]
+    for lat_deg, lon_deg, alt in sites:
+        lat, lon = np.deg2rad(lat_deg), np.deg2rad(lon_deg)
+        xyz0 = uvutils.XYZ_from_LatLonAlt(lat, lon, alt)
+        xyz_ref = uvutils.ECEF_from_ENU(enu, latitude=lat, longitude=lon, altitude=alt) - xyz0
+        xyz = _ecef_from_enu_relative(enu, lat, lon)
+        assert np.allclose(xyz, xyz_ref, rtol=0, atol=1e-6)
+
 if __name__ == "__main__":
-    test_uvw()
\ No newline at end of file
+    test_uvw()
+    test_calc_apparent_lst()
+    test_calc_zenith_icrs()
\ No newline at end of file
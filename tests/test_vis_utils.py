@@ -1,5 +1,5 @@
 from aa_uv.utils import zipit
-from aa_uv.vis_utils import vis_arr_to_matrix, vis_arr_to_matrix_4pol
+from aa_uv.vis_utils import vis_arr_to_matrix, vis_arr_to_matrix_4pol, remap_pols
 import numpy as np
 import pytest
 
@@ -45,6 +45,16 @@ def test_vis_arr_to_matrix_4pol():
      V = vis_arr_to_matrix_4pol(d, 256)
      assert V.shape == (256, 256, 4)
 
+def test_remap_pols():
+    d = (np.arange(24) + 1j * np.arange(24)).reshape((2, 3, 4)).astype('complex128')
+    pol_remap = [0, 3, 1, 2]
+    assert np.allclose(remap_pols(d, pol_remap), d[..., pol_remap])
+
+    d_out = remap_pols(d, pol_remap, conj=True, dtype='complex64')
+    assert d_out.dtype == np.complex64
+    assert np.allclose(d_out, np.conj(d[..., pol_remap]))
+
 if __name__ == "__main__":
     test_vis_arr_to_matrix()
-    test_vis_arr_to_matrix_4pol()
\ No newline at end of file
+    test_vis_arr_to_matrix_4pol()
+    test_remap_pols()
\ No newline at end of file
@@ -1,7 +1,20 @@
-from aa_uv.utils import load_config, load_yaml
+from aa_uv.utils import load_config, load_yaml, _load_config
+from aa_uv.io import load_observation_metadata
 
 def test_yaml():
     print(load_config('aavs2'))
 
+def test_load_observation_metadata_config_cache():
+    fn = 'test-data/aavs2_2x500ms/correlation_burst_204_20230927_35116_0.hdf5'
+    md = load_observation_metadata(fn, load_config='aavs2')
+    hits = _load_config.cache_info().hits
+
+    # Modifying returned metadata must not change the cached config
+    md['telescope_name'] = 'modified'
+    md2 = load_observation_metadata(fn, load_config='aavs2')
+    assert _load_config.cache_info().hits == hits + 1
+    assert md2['telescope_name'] == 'aavs2'
+
 if __name__ == "__main__":
-    test_yaml()
\ No newline at end of file
+    test_yaml()
+    test_load_observation_metadata_config_cache()
@@ -15,6 +15,7 @@ def test_run_in_parallel():
     run_in_parallel(task_list, n_workers=4)
 
     run_in_parallel(task_list, n_workers=2, backend='loky')
+    run_in_parallel(task_list, n_workers=2, backend='threading')
     run_in_parallel(task_list, n_workers=2, backend='dask')
 
 if __name__ == "__main__":